@@ -1,21 +1,49 @@
 import streamlit as st
+from bisect import bisect_right
 import plotly.graph_objects as go
 from datetime import datetime
+from string import Template
 
 # IMPORT MODUL (Sesuai nama file)
 from modules.asset_database import get_asset_list, get_asset_details
 from modules.standards import ISOZone
 from modules.vibration_diagnostics import analyze_vibration_matrix, VibPoint
-from modules.noise_diagnostics import analyze_noise_profile
+from modules.noise_diagnostics import analyze_noise_profile, NOISE_TYPES, NOISE_LOCATIONS, VALVE_TESTS
 from modules.temperature_diagnostics import analyze_temperature_profile
 from modules.electrical_diagnostics import analyze_electrical_health
 from modules.health_logic import assess_overall_health
 
 st.set_page_config(page_title="Reliability Pro", layout="wide")
 
-if 'mech_result' not in st.session_state: st.session_state.mech_result = None
-if 'elec_result' not in st.session_state: st.session_state.elec_result = None
-if 'health_result' not in st.session_state: st.session_state.health_result = None
+# Zona global dari vibrasi maksimum: batas terurut -> zona (bisect, tanpa if-ladder)
+_ZONE_LIMITS = (2.8, 7.1)
+_ZONE_BY_INDEX = (ISOZone.A.value, ISOZone.B.value, ISOZone.D.value)
+
+@st.cache_resource(max_entries=64)
+def _vib_gauge(value):
+    """Gauge vibrasi maksimum (objek Plotly di-cache per nilai, dipakai ulang antar rerun)."""
+    fig = go.Figure(go.Indicator(mode="gauge+number", value=value, title={'text':"Vib (mm/s)"}, gauge={'axis':{'range':[0,10]}, 'bar':{'color':'black'}, 'steps':[{'range':[0,2.8], 'color':'#2ecc71'}, {'range':[2.8,7.1], 'color':'#f1c40f'}, {'range':[7.1,10], 'color':'#e74c3c'}]}))
+    fig.update_layout(height=250, margin=dict(t=30,b=20,l=20,r=20))
+    return fig
+
+# Checklist fisik: (label checkbox, temuan yang dilaporkan)
+_PHYS_CHECKLIST = (
+    ("Major: Seal Bocor", "MAJOR: Seal Bocor"),
+    ("Major: Guard Hilang", "MAJOR: Guard Hilang"),
+    ("Minor: Baut Kendor", "MINOR: Baut Kendor"),
+    ("Minor: Oli Low/Dirty", "MINOR: Oli Kotor"),
+    ("Critical: Not Cost Effective", "CRITICAL: Not Cost Effective"),
+)
+
+# Kartu kesimpulan kesehatan (template dibangun sekali saat import)
+_HEALTH_CARD_BG = {"GOOD / PRIMA": "#d4edda", "FAIR / WARNING": "#fff3cd", "BAD / DANGER": "#f8d7da"}
+_HEALTH_CARD = Template("<div style='background:$bg;padding:20px;border-radius:10px;text-align:center;'><h1 style='color:$color'>$status</h1><h3>$desc</h3><hr>$action</div>")
+
+_STATE_DEFAULTS = {'mech_result': None, 'elec_result': None, 'health_result': None}
+# Inisialisasi sekali per sesi (satu sentinel, bukan cek per key tiap rerun)
+if '_comm_initialized' not in st.session_state:
+    st.session_state.update(_STATE_DEFAULTS)
+    st.session_state['_comm_initialized'] = True
 
 # SIDEBAR
 with st.sidebar:
@@ -30,8 +58,9 @@ with st.sidebar:
 st.title(f"Diagnosa: {asset.tag}")
 tab1, tab2, tab3 = st.tabs(["⚙️ MEKANIKAL", "⚡ ELEKTRIKAL", "🏥 KESIMPULAN"])
 
-# TAB 1
-with tab1:
+# TAB 1 (fragment: submit form mekanikal hanya me-rerun tab ini, bukan seluruh halaman)
+@st.fragment
+def _mech_tab():
     col1, col2 = st.columns([1.2, 1])
     with col1:
         with st.form("mech"):
@@ -62,16 +91,12 @@ with tab1:
 
             st.subheader("2. Fisik & Noise")
             with st.expander("Checklist Detail", expanded=True):
-                noise = st.selectbox("Noise:", ["Normal (Humming)", "Suara Kerikil/Letupan (Popping)", "Ngorok/Kasar (Growling)", "Mencicit (Squealing)", "Gemuruh (Rumbling)"])
-                loc = st.selectbox("Lokasi:", ["-", "Motor DE", "Motor NDE", "Pump DE", "Pump NDE", "Casing"])
-                v_test = st.radio("Valve Test:", ["Tidak Dilakukan", "Suara Stabil", "Suara Berubah Drastis (Recirculation)"], horizontal=True)
+                noise = st.selectbox("Noise:", NOISE_TYPES)
+                loc = st.selectbox("Lokasi:", NOISE_LOCATIONS)
+                v_test = st.radio("Valve Test:", VALVE_TESTS, horizontal=True)
                 
                 st.markdown("**Fisik:**")
-                chk_seal = st.checkbox("Major: Seal Bocor")
-                chk_guard = st.checkbox("Major: Guard Hilang")
-                chk_baut = st.checkbox("Minor: Baut Kendor")
-                chk_oli = st.checkbox("Minor: Oli Low/Dirty")
-                chk_cost = st.checkbox("Critical: Not Cost Effective")
+                phys_checks = [(finding, st.checkbox(label)) for label, finding in _PHYS_CHECKLIST]
 
             submit = st.form_submit_button("ANALISA MEKANIKAL")
 
@@ -92,31 +117,25 @@ with tab1:
         temp_c = analyze_temperature_profile(temps, asset.max_temp_bearing, noise, is_axial)
         
         max_v = max(r.value for r in readings)
-        if max_v < 2.8: z = ISOZone.A.value
-        elif max_v < 7.1: z = ISOZone.B.value
-        else: z = ISOZone.D.value
+        z = _ZONE_BY_INDEX[bisect_right(_ZONE_LIMITS, max_v)]
 
-        phys = []
-        if chk_seal: phys.append("MAJOR: Seal Bocor")
-        if chk_guard: phys.append("MAJOR: Guard Hilang")
-        if chk_baut: phys.append("MINOR: Baut Kendor")
-        if chk_oli: phys.append("MINOR: Oli Kotor")
-        if chk_cost: phys.append("CRITICAL: Not Cost Effective")
+        phys = [finding for finding, checked in phys_checks if checked]
 
         st.session_state.mech_result = {"max": max_v, "zone": z, "causes": vib_c+noise_c+temp_c, "temps": temps, "phys": phys}
 
     with col2:
         if st.session_state.mech_result:
             res = st.session_state.mech_result
-            fig = go.Figure(go.Indicator(mode="gauge+number", value=res['max'], title={'text':"Vib (mm/s)"}, gauge={'axis':{'range':[0,10]}, 'bar':{'color':'black'}, 'steps':[{'range':[0,2.8], 'color':'#2ecc71'}, {'range':[2.8,7.1], 'color':'#f1c40f'}, {'range':[7.1,10], 'color':'#e74c3c'}]}))
-            fig.update_layout(height=250, margin=dict(t=30,b=20,l=20,r=20))
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_vib_gauge(res['max']), use_container_width=True)
             st.info(res['zone'])
             if res['causes']: 
                 for c in res['causes']: st.error(c)
             if res['phys']:
                 for p in res['phys']: st.warning(p)
 
+with tab1:
+    _mech_tab()
+
 # TAB 2
 with tab2:
     with st.form("elec"):
@@ -159,7 +178,7 @@ with tab3:
             
     if st.session_state.health_result:
         hr = st.session_state.health_result
-        st.markdown(f"<div style='background:{'#d4edda' if hr['status']=='GOOD' else '#f8d7da'};padding:20px;border-radius:10px;text-align:center;'><h1 style='color:{hr['color']}'>{hr['status']}</h1><h3>{hr['desc']}</h3><hr>{hr['action']}</div>", unsafe_allow_html=True)
+        st.markdown(_HEALTH_CARD.substitute(hr, bg=_HEALTH_CARD_BG.get(hr['status'], '#f8d7da')), unsafe_allow_html=True)
         if hr['reasons']:
             st.error("FAKTOR PENYEBAB:")
-            for r in hr['reasons']: st.write(f"❌ {r}")
+            st.markdown("  \n".join(f"❌ {r}" for r in hr['reasons']))
@@ -1,21 +1,60 @@
 # iso_logic.py
+from bisect import bisect_left
+from dataclasses import astuple, dataclass
+
+import numpy as np
+
+@dataclass(frozen=True, slots=True)
+class ISOLimits:
+    """Batas Zone A/B, B/C, C/D (mm/s)."""
+    A: float = 1.12
+    B: float = 2.80
+    C: float = 7.10
+
+# Limit TKI C-04 (2025) Halaman 7 untuk Class II (Medium Machines), dibangun sekali saat import
+LIMITS = ISOLimits()
+# Batas terurut untuk bisect, diturunkan dari LIMITS (satu sumber nilai)
+_LIMITS_SORTED = astuple(LIMITS)
+
+# Status per Zone A / B / C / D (indeks = hasil bisect)
+_ISO_STATUS = (
+    ("GOOD", "success"),
+    ("SATISFACTORY", "warning"),
+    ("UNSATISFACTORY", "orange"),
+    ("UNACCEPTABLE", "error"),
+)
 
 def get_iso_status(velocity_rms, machine_class="Class II"):
     """
     Menentukan Zona Vibrasi berdasarkan ISO 10816-1 (Referensi TKI C-04 2025).
     """
-    # Limit TKI C-04 (2025) Halaman 7 untuk Class II (Medium Machines)
-    # Zone A / B / C / D
-    limits = [1.12, 2.80, 7.10] 
-    
-    if velocity_rms <= limits[0]:
-        return "GOOD", "success"
-    elif velocity_rms <= limits[1]:
-        return "SATISFACTORY", "warning"
-    elif velocity_rms <= limits[2]:
-        return "UNSATISFACTORY", "orange"
-    else:
-        return "UNACCEPTABLE", "error"
+    # NaN / di atas batas C/D -> UNACCEPTABLE (bisect_left memetakan NaN ke indeks 0 = GOOD)
+    if not velocity_rms <= LIMITS.C: return _ISO_STATUS[-1]
+    # bisect_left: nilai tepat di batas masih masuk zona yang lebih baik (<=)
+    return _ISO_STATUS[bisect_left(_LIMITS_SORTED, velocity_rms)]
+
+def get_iso_status_batch(velocities, machine_class="Class II"):
+    """
+    Versi batch get_iso_status: list (status, warna) untuk banyak nilai velocity RMS sekaligus.
+    """
+    # side='left' = bisect_left di get_iso_status (batas dari LIMITS yang sama)
+    idx = np.searchsorted(np.array(astuple(LIMITS)), np.asarray(velocities, dtype=np.float64), side='left')
+    return [_ISO_STATUS[i] for i in idx.tolist()]
+
+# Peta Diagnosa TKI C-017 (2018) Tabel 1 (Titik -> Indikasi)
+# Urutan dipertahankan: kunci pertama yang cocok dipakai.
+_DIAG_MAP = {
+    "Motor NDE V": "**Paralel Misalignment**",  # Motor Outboard Vertical
+    "Motor NDE H": "**Bearing Looseness**",     # Motor Outboard Horizontal
+    "Motor DE V": "**Misalignment**",           # Motor Inboard Vertical
+    "Motor DE H": "**Bearing Looseness**",      # Motor Inboard Horizontal
+    "Motor DE A": "**Misalignment**",           # Motor Inboard Axial
+    "Pump DE V": "**Bearing Looseness**",       # Pump Inboard Vertical (Sisi dekat kopling)
+    "Pump DE H": "**Kavitasi** atau Kondisi Aman (Cek Flow)",  # Pump Inboard Horizontal
+    "Pump DE A": "**Paralel Misalignment**",    # Pump Inboard Axial
+    "Pump NDE V": "**Unbalance** dan **Looseness**",  # Pump Outboard Vertical
+    "Pump NDE H": "**Bearing Looseness**",      # Pump Outboard Horizontal
+}
 
 def analyze_root_cause(high_vib_points):
     """
@@ -25,29 +64,13 @@ def analyze_root_cause(high_vib_points):
     diagnoses = []
     
     for point, value in high_vib_points.items():
-        # Logika Diagnosa TKI C-017 Tabel 1
-        if "Motor NDE V" in point: # Motor Outboard Vertical
-            diagnoses.append(f"Titik {point}: Indikasi **Paralel Misalignment**.")
-        elif "Motor NDE H" in point: # Motor Outboard Horizontal
-            diagnoses.append(f"Titik {point}: Indikasi **Bearing Looseness**.")
-        elif "Motor DE V" in point: # Motor Inboard Vertical
-            diagnoses.append(f"Titik {point}: Indikasi **Misalignment**.")
-        elif "Motor DE H" in point: # Motor Inboard Horizontal
-            diagnoses.append(f"Titik {point}: Indikasi **Bearing Looseness**.")
-        elif "Motor DE A" in point: # Motor Inboard Axial
-            diagnoses.append(f"Titik {point}: Indikasi **Misalignment**.")
-            
-        elif "Pump DE V" in point: # Pump Inboard Vertical (Sisi dekat kopling)
-            diagnoses.append(f"Titik {point}: Indikasi **Bearing Looseness**.")
-        elif "Pump DE H" in point: # Pump Inboard Horizontal
-            diagnoses.append(f"Titik {point}: Indikasi **Kavitasi** atau Kondisi Aman (Cek Flow).")
-        elif "Pump DE A" in point: # Pump Inboard Axial
-            diagnoses.append(f"Titik {point}: Indikasi **Paralel Misalignment**.")
-            
-        elif "Pump NDE V" in point: # Pump Outboard Vertical
-            diagnoses.append(f"Titik {point}: Indikasi **Unbalance** dan **Looseness**.")
-        elif "Pump NDE H" in point: # Pump Outboard Horizontal
-            diagnoses.append(f"Titik {point}: Indikasi **Bearing Looseness**.")
+        # Nama titik persis -> lookup langsung, selain itu cari kunci di dalam nama titik
+        indikasi = _DIAG_MAP.get(point)
+        if indikasi is None:
+            key = next((k for k in _DIAG_MAP if k in point), None)
+            if key is None: continue
+            indikasi = _DIAG_MAP[key]
+        diagnoses.append(f"Titik {point}: Indikasi {indikasi}.")
             
     if not diagnoses:
         diagnoses.append("Pola vibrasi umum. Lakukan analisa spektrum lanjutan.")
@@ -2,24 +2,28 @@ from typing import List, Tuple
 import numpy as np
 from .standards import Limits
 
+def calculate_unbalance(values, avg=None):
+    vals = np.asarray(values, dtype=np.float64)
+    if avg is None: avg = vals.mean()
+    return float(np.abs(vals - avg).max() / avg * 100) if avg > 0 else 0.0
+
 def analyze_electrical_health(v_in, i_in, i_g, rated_v, flc):
     diagnosa = []
-    avg_v = np.mean(v_in)
-    avg_i = np.mean(i_in)
-    
-    def calc_unb(vals):
-        avg = np.mean(vals)
-        return (max(abs(v - avg) for v in vals) / avg * 100) if avg > 0 else 0.0
+    v_in = np.asarray(v_in, dtype=np.float64)
+    i_in = np.asarray(i_in, dtype=np.float64)
+    avg_v = v_in.mean()
+    avg_i = i_in.mean()
+    max_i = i_in.max()
 
-    v_unbal = calc_unb(v_in)
-    i_unbal = calc_unb(i_in)
+    v_unbal = calculate_unbalance(v_in, avg_v)
+    i_unbal = calculate_unbalance(i_in, avg_i)
 
     if avg_v < (rated_v * 0.90): diagnosa.append(f"⚡ ANSI 27 - UNDERVOLTAGE ({avg_v:.0f}V)")
     if avg_v > (rated_v * 1.10): diagnosa.append(f"⚡ ANSI 59 - OVERVOLTAGE ({avg_v:.0f}V)")
     if v_unbal > Limits.VOLT_UNBALANCE_LIMIT: diagnosa.append(f"⚡ ANSI 47 - VOLT UNBALANCE ({v_unbal:.1f}%)")
     
     if avg_i < (flc * 0.40) and avg_i > 1.0: diagnosa.append(f"💧 ANSI 37 - DRY RUN ({avg_i:.1f}A)")
-    if max(i_in) > (flc * 1.10): diagnosa.append(f"🔥 ANSI 51 - OVERLOAD ({max(i_in):.1f}A)")
+    if max_i > (flc * 1.10): diagnosa.append(f"🔥 ANSI 51 - OVERLOAD ({max_i:.1f}A)")
     if i_unbal > Limits.CURR_UNBALANCE_LIMIT: diagnosa.append(f"⚖️ ANSI 46 - CURR UNBALANCE ({i_unbal:.1f}%)")
     if i_g > 0.5: diagnosa.append(f"⚠️ ANSI 50G - GROUND FAULT ({i_g}A)")
 
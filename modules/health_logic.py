@@ -1,101 +1,165 @@
-from typing import List, Dict
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Optional
 
-def assess_overall_health(vib_status: str, elec_status: str, temp_max: float, physical_issues: List[str], tech_diagnoses: List[str]) -> Dict:
+# --- 1. KAMUS REKOMENDASI & STANDAR (UPDATED SESUAI STANDAR PERUSAHAAN) ---
+_KNOWLEDGE_BASE = {
+    # MEKANIKAL (PUMP & VIBRATION)
+    "Misalignment": ("Lakukan Laser Alignment ulang. Cek shimming & Soft Foot.", "API 686 / ISO 13709"),
+    "Unbalance": ("Lakukan Balancing Impeller (Grade G2.5/G6.3).", "ISO 21940 (Balancing)"),
+    "Soft Foot": ("Cek kekencangan baut kaki motor. Perbaiki shim.", "API 686 Ch. 5"),
+    "Bearing": ("Jadwalkan penggantian Bearing. Cek clearance.", "ISO 13709 (API 610)"),
+    "Looseness": ("Kencangkan baut pondasi/baseplate.", "ISO 13709 / API 686"),
+    "Bent Shaft": ("Cek run-out poros (Max 0.05mm).", "ISO 13709 (API 610)"),
+    "Kavitasi": ("Cek NPSH Available & Strainer Suction.", "ISO 13709 (API 610)"),
+    "Flow": ("Atur valve discharge ke range BEP (Best Efficiency Point).", "ISO 13709 (API 610)"),
     
+    # SUHU & ELEKTRIKAL (IEC STANDARD)
+    "Overheat": ("Cek sistem pendingin (Fan/Sirip) & Beban.", "IEC 60034-1 (Thermal Class)"),
+    "Volt": ("Cek tegangan input. Pastikan variasi < 10%.", "IEC 60034-1 (Rating & Performance)"),
+    "Curr": ("Cek beban motor (Overload) & Keseimbangan Fasa.", "IEC 60034-1"),
+    
+    # FISIK & SAFETY
+    "Seal": ("Ganti Mechanical Seal. Cek flushing system.", "API 682 / ISO 21049"),
+    "Guard": ("Pasang Coupling Guard (Safety Hazard).", "OSHA 1910 / ISO 45001"),
+    "Ground": ("Perbaiki kabel Grounding (Electrical Safety).", "OSHA 1910 / PUIL")
+}
+
+# Keyword di-uppercase sekali saat import (urutan kamus tetap dipertahankan)
+_KB_UPPER = {kw.upper(): entry for kw, entry in _KNOWLEDGE_BASE.items()}
+
+# Satu pola gabungan untuk semua keyword (satu kali scan per diagnosa).
+# Lookahead agar keyword yang saling tumpang tindih tetap terdeteksi semua.
+_KB_MATCHER = re.compile("(?=(%s))" % "|".join(map(re.escape, _KB_UPPER)))
+
+
+# --- STATUS VIBRASI (ISO 20816) & ELEKTRIKAL: token -> (severity, label, standar) ---
+_VIB_RULES = {
+    "ZONE D": (3, "KRITIS", "ISO 20816 (Vibration Severity)"), # Updated dari 10816
+    "ZONE C": (1, "TINGGI", "ISO 20816 (Vibration Severity)"), # Updated dari 10816
+    "ZONE A": (0, None, "ISO 20816 (New Machine)"), # Updated dari 10816
+}
+_ELEC_SEVERITY = {"TRIP": 3}
+
+# --- TEMUAN FISIK: keyword -> severity (MAJOR/CRITICAL mengalahkan MINOR) ---
+_ISSUE_SEVERITY = {"MAJOR": 5, "CRITICAL": 5, "MINOR": 1}
+_ISSUE_SEVERITY_RE = re.compile("|".join(_ISSUE_SEVERITY))  # dijalankan pada teks upper-case
+# Mapping manual standar fisik
+_ISSUE_STANDARDS = {"Seal": "API 682", "Guard": "ISO 45001 (Safety)", "Oli": "ISO 12922 (Lubricants)"}
+_ISSUE_STANDARD_RE = re.compile("|".join(_ISSUE_STANDARDS))
+
+# --- KESIMPULAN: field konstan per status (read-only, dibagi semua hasil) ---
+_STATUS_BAD = MappingProxyType({"status": "BAD / DANGER", "color": "#e74c3c", "desc": "KONDISI KRITIS - STOP OPERASI", "action": "❌ SEGERA LAKUKAN PERBAIKAN (Lihat Rekomendasi)"})
+_STATUS_FAIR = MappingProxyType({"status": "FAIR / WARNING", "color": "#f1c40f", "desc": "PERLU MONITORING KETAT", "action": "⚠️ JADWALKAN MAINTENANCE (Planned WO)"})
+_STATUS_GOOD = MappingProxyType({"status": "GOOD / PRIMA", "color": "#2ecc71", "desc": "SIAP OPERASI", "action": "✅ LANJUTKAN OPERASI RUTIN"})
+# Indeks level = _level(severity)
+_STATUS_BY_LEVEL = (_STATUS_GOOD, _STATUS_FAIR, _STATUS_BAD)
+
+def _status_token(status: str) -> str:
+    """'ZONE D: DAMAGE' -> 'ZONE D', 'Trip' -> 'TRIP'"""
+    return status.split(":", 1)[0].strip().upper()
+
+# --- SEVERITY PER KOMPONEN (dipakai bersama _severity_level & _assess_cached) ---
+def _vib_rule(vib_status: str) -> Optional[tuple]:
+    """(severity, label, standar) untuk status vibrasi, None jika tidak ada rule."""
+    return _VIB_RULES.get(_status_token(vib_status))
+
+def _elec_severity(elec_status: str) -> int:
+    return _ELEC_SEVERITY.get(_status_token(elec_status), 0)
+
+def _temp_severity(temp_max: float) -> int:
+    return 3 if temp_max > 85.0 else 0
+
+def _issue_severity(issue: str) -> int:
+    """Severity satu temuan fisik (keyword terberat menang)."""
+    return max((_ISSUE_SEVERITY[kw] for kw in _ISSUE_SEVERITY_RE.findall(issue.upper())), default=0)
+
+def _level(severity: int) -> int:
+    """Skor total -> indeks _STATUS_BY_LEVEL (0=GOOD, 1=FAIR, 2=BAD)."""
+    return (severity >= 1) + (severity >= 3)
+
+def _severity_level(vib_status: str, elec_status: str, temp_max: float, physical_issues: List[str]) -> int:
+    """Level status saja (0=GOOD, 1=FAIR, 2=BAD), berhenti begitu severity >= 3."""
     severity = 0
-    reasons = []
-    recommendations = []
-    standards_used = set() 
+    # Urut dari bobot terbesar: fisik MAJOR/CRITICAL (5) -> ZONE D / TRIP / suhu (3)
+    for issue in physical_issues:
+        severity += _issue_severity(issue)
+        if severity >= 3: return 2
+    vib_rule = _vib_rule(vib_status)
+    if vib_rule: severity += vib_rule[0]
+    if severity >= 3: return 2
+    severity += _elec_severity(elec_status) + _temp_severity(temp_max)
+    return _level(severity)
 
-    # --- 1. KAMUS REKOMENDASI & STANDAR (UPDATED SESUAI STANDAR PERUSAHAAN) ---
-    knowledge_base = {
-        # MEKANIKAL (PUMP & VIBRATION)
-        "Misalignment": ("Lakukan Laser Alignment ulang. Cek shimming & Soft Foot.", "API 686 / ISO 13709"),
-        "Unbalance": ("Lakukan Balancing Impeller (Grade G2.5/G6.3).", "ISO 21940 (Balancing)"),
-        "Soft Foot": ("Cek kekencangan baut kaki motor. Perbaiki shim.", "API 686 Ch. 5"),
-        "Bearing": ("Jadwalkan penggantian Bearing. Cek clearance.", "ISO 13709 (API 610)"),
-        "Looseness": ("Kencangkan baut pondasi/baseplate.", "ISO 13709 / API 686"),
-        "Bent Shaft": ("Cek run-out poros (Max 0.05mm).", "ISO 13709 (API 610)"),
-        "Kavitasi": ("Cek NPSH Available & Strainer Suction.", "ISO 13709 (API 610)"),
-        "Flow": ("Atur valve discharge ke range BEP (Best Efficiency Point).", "ISO 13709 (API 610)"),
-        
-        # SUHU & ELEKTRIKAL (IEC STANDARD)
-        "Overheat": ("Cek sistem pendingin (Fan/Sirip) & Beban.", "IEC 60034-1 (Thermal Class)"),
-        "Volt": ("Cek tegangan input. Pastikan variasi < 10%.", "IEC 60034-1 (Rating & Performance)"),
-        "Curr": ("Cek beban motor (Overload) & Keseimbangan Fasa.", "IEC 60034-1"),
-        
-        # FISIK & SAFETY
-        "Seal": ("Ganti Mechanical Seal. Cek flushing system.", "API 682 / ISO 21049"),
-        "Guard": ("Pasang Coupling Guard (Safety Hazard).", "OSHA 1910 / ISO 45001"),
-        "Ground": ("Perbaiki kabel Grounding (Electrical Safety).", "OSHA 1910 / PUIL")
+def assess_overall_health(vib_status: str, elec_status: str, temp_max: float, physical_issues: List[str], tech_diagnoses: Optional[List[str]] = None, collect_details: bool = True) -> Dict:
+    # collect_details=False: hanya status (badge), reasons/recommendations/standards dikosongkan
+    if not collect_details:
+        level = _severity_level(vib_status, elec_status, float(temp_max), physical_issues)
+        return {**_STATUS_BY_LEVEL[level], "reasons": [], "recommendations": [], "standards": []}
+
+    # Input di-freeze jadi tuple agar bisa jadi key cache (urutan tetap dipertahankan)
+    result = _assess_cached(vib_status, elec_status, float(temp_max), tuple(physical_issues), tuple(tech_diagnoses or ()))
+    # Salin list agar hasil di cache tidak ikut termutasi oleh pemanggil
+    return {
+        **result,
+        "reasons": list(result["reasons"]),
+        "recommendations": list(result["recommendations"]),
+        "standards": list(result["standards"])
     }
 
+@lru_cache(maxsize=512)
+def _assess_cached(vib_status: str, elec_status: str, temp_max: float, physical_issues: tuple, tech_diagnoses: tuple) -> Dict:
+    
+    # Normalisasi upper-case sekali di awal untuk pencocokan keyword diagnosa
+    diags_u = [d.upper() for d in tech_diagnoses]
+
+    reasons = []
+    recommendations = {}  # dict sebagai ordered-set (dedupe O(1))
+    standards_used = set() 
+
     # --- 2. ANALISA VIBRASI (GANTI KE ISO 20816) ---
-    if "ZONE D" in vib_status: 
-        severity += 3
-        reasons.append(f"Vibrasi KRITIS ({vib_status})")
-        standards_used.add("ISO 20816 (Vibration Severity)") # Updated dari 10816
-    elif "ZONE C" in vib_status: 
-        severity += 1
-        reasons.append(f"Vibrasi TINGGI ({vib_status})")
-        standards_used.add("ISO 20816 (Vibration Severity)") # Updated dari 10816
-    elif "ZONE A" in vib_status:
-        standards_used.add("ISO 20816 (New Machine)") # Updated dari 10816
+    vib_sev = 0
+    vib_rule = _vib_rule(vib_status)
+    if vib_rule:
+        vib_sev, vib_label, vib_std = vib_rule
+        if vib_label: reasons.append(f"Vibrasi {vib_label} ({vib_status})")
+        standards_used.add(vib_std)
 
     # --- 3. ANALISA DIAGNOSA TEKNIS ---
-    for diag in tech_diagnoses:
+    for diag, diag_u in zip(tech_diagnoses, diags_u):
         reasons.append(diag)
-        for keyword, (action, std) in knowledge_base.items():
-            if keyword.upper() in diag.upper():
-                if action not in recommendations: recommendations.append(action)
+        hits = {m.group(1) for m in _KB_MATCHER.finditer(diag_u)}
+        if not hits: continue
+        # Urutan rekomendasi mengikuti urutan _KNOWLEDGE_BASE
+        for keyword, (action, std) in _KB_UPPER.items():
+            if keyword in hits:
+                recommendations[action] = None
                 standards_used.add(std)
 
     # --- 4. ANALISA FISIK ---
-    if "TRIP" in elec_status: 
-        severity += 3
+    elec_sev = _elec_severity(elec_status)
+    if elec_sev: 
         reasons.append("Elektrikal TRIP")
-        recommendations.append("Cek Panel & Isolasi Motor.")
-    
-    if temp_max > 85.0: 
-        severity += 3
+        recommendations["Cek Panel & Isolasi Motor."] = None
         
+    phys_sev = 0
     for issue in physical_issues:
-        if "MAJOR" in issue.upper() or "CRITICAL" in issue.upper():
-            severity += 5
-            reasons.append(f"Fisik: {issue}")
-        elif "MINOR" in issue.upper():
-            severity += 1
+        issue_sev = _issue_severity(issue)
+        if issue_sev:
+            phys_sev += issue_sev
             reasons.append(f"Fisik: {issue}")
         
-        # Mapping manual standar fisik
-        if "Seal" in issue: standards_used.add("API 682")
-        if "Guard" in issue: standards_used.add("ISO 45001 (Safety)")
-        if "Oli" in issue: standards_used.add("ISO 12922 (Lubricants)")
+        standards_used.update(_ISSUE_STANDARDS[kw] for kw in _ISSUE_STANDARD_RE.findall(issue))
 
     # --- 5. KESIMPULAN FINAL ---
-    if severity >= 3:
-        status = "BAD / DANGER"
-        color = "#e74c3c"
-        desc = "KONDISI KRITIS - STOP OPERASI"
-        final_action = "❌ SEGERA LAKUKAN PERBAIKAN (Lihat Rekomendasi)"
-    elif severity >= 1:
-        status = "FAIR / WARNING"
-        color = "#f1c40f"
-        desc = "PERLU MONITORING KETAT"
-        final_action = "⚠️ JADWALKAN MAINTENANCE (Planned WO)"
-    else:
-        status = "GOOD / PRIMA"
-        color = "#2ecc71"
-        desc = "SIAP OPERASI"
-        final_action = "✅ LANJUTKAN OPERASI RUTIN"
-        if not recommendations: recommendations.append("Pertahankan kondisi operasi.")
+    # Skor total dari helper severity yang sama dengan _severity_level
+    severity = vib_sev + elec_sev + _temp_severity(temp_max) + phys_sev
+    if severity == 0 and not recommendations: recommendations["Pertahankan kondisi operasi."] = None
 
     return {
-        "status": status,
-        "color": color,
-        "desc": desc,
-        "action": final_action,
-        "reasons": reasons,
-        "recommendations": recommendations,
-        "standards": list(standards_used)
+        **_STATUS_BY_LEVEL[_level(severity)],
+        "reasons": tuple(reasons),
+        "recommendations": tuple(recommendations),
+        "standards": tuple(standards_used)
     }
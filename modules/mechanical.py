@@ -1,86 +1,218 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
+from bisect import bisect_right
+from functools import lru_cache
 
 # --- 1. DEFINISI STANDAR ISO 10816-3 & WARNA ---
+# Batas Limit [Batas A/B, Batas B/C, Batas C/D]
+# Referensi: ISO 10816-3 untuk Rigid Foundation (Umum di pompa)
+_ISO_LIMITS = {
+    "Class I (Kecil <15kW)": np.array([0.71, 1.80, 4.50]),
+    "Class II (Medium 15-300kW)": np.array([1.12, 2.80, 4.50]), # Standard Pompa Sentrifugal
+    "Class III (Besar >300kW Rigid)": np.array([1.80, 4.50, 7.10]),
+    "Class IV (Besar Soft)": np.array([2.80, 7.10, 11.20])
+}
+
+# Zona A (Green) / B (Yellow) / C (Orange) / D (Red), indeks = hasil searchsorted
+_ZONE_CODES = np.array(["A", "B", "C", "D"])
+_ZONE_REMARKS = np.array([
+    "New machine condition",
+    "Unlimited long-term operation allowable",
+    "Short-term operation allowable",
+    "Vibration causes damage"
+])
+_ZONE_COLORS = np.array(["green", "yellow", "orange", "red"])
+
+# Salinan tuple untuk jalur skalar get_iso_zone (bisect, tanpa overhead dispatch NumPy)
+_ISO_LIMITS_T = {cls: tuple(limits.tolist()) for cls, limits in _ISO_LIMITS.items()}
+_ZONE_INFO = tuple(zip(_ZONE_CODES.tolist(), _ZONE_REMARKS.tolist(), _ZONE_COLORS.tolist()))
+
+# Styling kolom Remark per Zona (Highlighting Background)
+_ZONE_CSS = {
+    "A": 'background-color: #90ee90; color: black; font-weight: bold;', # Hijau (Zone A)
+    "B": 'background-color: #ffd700; color: black; font-weight: bold;', # Kuning (Zone B)
+    "C": 'background-color: #ffa500; color: black; font-weight: bold;', # Oranye (Zone C)
+    "D": 'background-color: #ff4b4b; color: white; font-weight: bold;'  # Merah (Zone D)
+}
+
+# Pilihan kelas mesin (urutan = urutan _ISO_LIMITS)
+_MACHINE_CLASSES = tuple(_ISO_LIMITS)
+
+# Limit ambang batas Warning (Zona C) untuk trigger diagnosa = batas B/C (Kuning ke Oranye)
+_WARNING_THRESHOLDS = {cls: float(limits[1]) for cls, limits in _ISO_LIMITS.items()}
+
+def get_iso_zones(values, machine_class):
+    """
+    Versi vektor get_iso_zone: satu binary search (searchsorted) untuk banyak
+    nilai Velocity RMS sekaligus. Return array (zona, remark, warna).
+    """
+    # side='right': nilai tepat di batas masuk zona berikutnya (value < limit)
+    idx = np.searchsorted(_ISO_LIMITS[machine_class], values, side='right')
+    return _ZONE_CODES[idx], _ZONE_REMARKS[idx], _ZONE_COLORS[idx]
+
 def get_iso_zone(value, machine_class):
     """
     Menentukan Zona ISO dan Warna berdasarkan Velocity RMS (mm/s).
     """
-    # Batas Limit [Batas A/B, Batas B/C, Batas C/D]
-    # Referensi: ISO 10816-3 untuk Rigid Foundation (Umum di pompa)
-    limits = {
-        "Class I (Kecil <15kW)": [0.71, 1.80, 4.50],
-        "Class II (Medium 15-300kW)": [1.12, 2.80, 4.50], # Standard Pompa Sentrifugal
-        "Class III (Besar >300kW Rigid)": [1.80, 4.50, 7.10],
-        "Class IV (Besar Soft)": [2.80, 7.10, 11.20]
-    }
-    
-    lim = limits[machine_class]
-    
-    # Logika Penentuan Zona & Warna
-    if value < lim[0]:
-        # ZONE A: Green
-        return "A", "New machine condition", "green"
-    elif value < lim[1]:
-        # ZONE B: Yellow
-        return "B", "Unlimited long-term operation allowable", "yellow"
-    elif value < lim[2]:
-        # ZONE C: Orange
-        return "C", "Short-term operation allowable", "orange"
-    else:
-        # ZONE D: Red
-        return "D", "Vibration causes damage", "red"
+    # bisect_right: nilai tepat di batas masuk zona berikutnya (sama dengan get_iso_zones)
+    return _ZONE_INFO[bisect_right(_ISO_LIMITS_T[machine_class], value)]
 
 # --- 2. LOGIKA DIAGNOSA KERUSAKAN (AI DIAGNOSTIC) ---
-def analyze_root_cause(h_val, v_val, a_val, warning_threshold):
+# Bit flag hasil klasifikasi (0 = Kondisi Normal)
+RC_MISALIGNMENT = 1
+RC_UNBALANCE = 2
+RC_LOOSENESS = 4
+RC_BEARING = 8
+
+# Flag -> (Diagnosa, Rekomendasi), urutan = urutan tampil
+_ROOT_CAUSE_TEXT = (
+    (RC_MISALIGNMENT, "Angular Misalignment (Poros Miring)", (
+        "Cek alignment kopling (Laser/Dial). Pastikan offset < 0.05mm.",
+        "Cek 'Pipe Strain' (Pipa menekan pompa).")),
+    (RC_UNBALANCE, "Unbalance (Massa Tidak Seimbang)", (
+        "Cek fisik impeller/kipas motor dari kotoran/kerak.",
+        "Lakukan balancing ulang (Standar G2.5/G6.3).")),
+    (RC_LOOSENESS, "Mechanical Looseness / Soft Foot", (
+        "Kencangkan baut angkur (Anchor Bolt).",
+        "Cek kerataan kaki motor (Soft foot) dengan feeler gauge.")),
+    (RC_BEARING, "Indikasi Kerusakan Bearing / Kavitasi", (
+        "Cek lubrikasi (Greasing).",
+        "Analisa suara bearing (Stetoskop).",
+        "Cek tekanan suction (Kavitasi).")),
+)
+
+def classify_root_cause(h_val, v_val, a_val, warning_threshold):
     """
-    Diagnosa akar masalah (Misalignment, Unbalance, Looseness, Bearing)
-    berdasarkan perbandingan arah getaran.
+    Inti numerik analyze_root_cause. Return bitmask RC_* (0 = Kondisi Normal).
     """
-    diagnosa = []
-    rekomendasi = []
-    
-    # Ambil nilai tertinggi untuk safety factor
-    max_val = max(h_val, v_val, a_val)
-    
     # Jika getaran masih Zona A atau B (Aman/Kuning), diagnosa normal
     # Kita ambil threshold batas B ke C (misal 2.80 untuk Class II)
-    if max_val < warning_threshold:
-        return ["Kondisi Normal"], ["Lanjutkan monitoring rutin (Predictive Maintenance)"]
+    max_radial = max(h_val, v_val)
+    if max(max_radial, a_val) < warning_threshold:
+        return 0
 
+    flags = 0
     # --- RULE 1: MISALIGNMENT (Ketidaklurusan) ---
     # Ciri: Getaran Axial tinggi (Dominan > 50% dari Radial tertinggi)
-    if a_val > (0.5 * max(h_val, v_val)) and a_val > (warning_threshold * 0.8):
-        diagnosa.append("Angular Misalignment (Poros Miring)")
-        rekomendasi.append("Cek alignment kopling (Laser/Dial). Pastikan offset < 0.05mm.")
-        rekomendasi.append("Cek 'Pipe Strain' (Pipa menekan pompa).")
+    if a_val > (0.5 * max_radial) and a_val > (warning_threshold * 0.8):
+        flags |= RC_MISALIGNMENT
 
     # --- RULE 2: UNBALANCE (Tidak Seimbang) ---
     # Ciri: Radial (H/V) tinggi, Axial rendah. Biasanya frekuensi 1x RPM.
-    if (h_val > warning_threshold or v_val > warning_threshold) and a_val < (0.5 * max(h_val, v_val)):
-        diagnosa.append("Unbalance (Massa Tidak Seimbang)")
-        rekomendasi.append("Cek fisik impeller/kipas motor dari kotoran/kerak.")
-        rekomendasi.append("Lakukan balancing ulang (Standar G2.5/G6.3).")
+    if (h_val > warning_threshold or v_val > warning_threshold) and a_val < (0.5 * max_radial):
+        flags |= RC_UNBALANCE
 
     # --- RULE 3: MECHANICAL LOOSENESS / SOFT FOOT ---
     # Ciri: Vertikal jauh lebih tinggi dari Horizontal pada tumpuan.
     if v_val > (1.5 * h_val) and v_val > warning_threshold:
-        diagnosa.append("Mechanical Looseness / Soft Foot")
-        rekomendasi.append("Kencangkan baut angkur (Anchor Bolt).")
-        rekomendasi.append("Cek kerataan kaki motor (Soft foot) dengan feeler gauge.")
+        flags |= RC_LOOSENESS
 
     # --- RULE 4: BEARING ISSUE (Umum) ---
     # Jika getaran tinggi tapi pola tidak spesifik ke arah tertentu
-    if not diagnosa: # Jika list diagnosa masih kosong tapi nilai tinggi
-        diagnosa.append("Indikasi Kerusakan Bearing / Kavitasi")
-        rekomendasi.append("Cek lubrikasi (Greasing).")
-        rekomendasi.append("Analisa suara bearing (Stetoskop).")
-        rekomendasi.append("Cek tekanan suction (Kavitasi).")
+    return flags or RC_BEARING
+
+def classify_root_cause_batch(h_val, v_val, a_val, warning_threshold):
+    """
+    Versi batch classify_root_cause untuk banyak titik/mesin sekaligus (array H, V, A).
+    Return array bitmask RC_* dengan aturan yang sama.
+    """
+    h = np.asarray(h_val, dtype=np.float64)
+    v = np.asarray(v_val, dtype=np.float64)
+    a = np.asarray(a_val, dtype=np.float64)
+    max_radial = np.maximum(h, v)
+
+    flags = (np.where((a > 0.5 * max_radial) & (a > warning_threshold * 0.8), RC_MISALIGNMENT, 0)
+             | np.where(((h > warning_threshold) | (v > warning_threshold)) & (a < 0.5 * max_radial), RC_UNBALANCE, 0)
+             | np.where((v > 1.5 * h) & (v > warning_threshold), RC_LOOSENESS, 0))
+    flags = np.where(flags == 0, RC_BEARING, flags)
+    return np.where(np.maximum(max_radial, a) < warning_threshold, 0, flags)
+
+def analyze_root_cause(h_val, v_val, a_val, warning_threshold):
+    """
+    Diagnosa akar masalah (Misalignment, Unbalance, Looseness, Bearing)
+    berdasarkan perbandingan arah getaran.
+    Return tuple (diagnosa, rekomendasi) yang immutable (hasil di-cache).
+    """
+    # Key cache = nilai mentah (float hashable), tanpa pembulatan agar verdict tidak berubah
+    return _analyze_root_cause_cached(h_val, v_val, a_val, warning_threshold)
 
-    return diagnosa, rekomendasi
+_NORMAL_RESULT = (("Kondisi Normal",), ("Lanjutkan monitoring rutin (Predictive Maintenance)",))
+# Penanda kondisi normal untuk UI (dibandingkan ==, hasil st.cache_data berupa salinan)
+_NORMAL_DIAG = _NORMAL_RESULT[0]
 
-# --- 3. APLIKASI UTAMA ---
+@lru_cache(maxsize=256)
+def _analyze_root_cause_cached(h_val, v_val, a_val, warning_threshold):
+    flags = classify_root_cause(h_val, v_val, a_val, warning_threshold)
+    if not flags:
+        return _NORMAL_RESULT
+
+    diagnosa = []
+    rekomendasi = []
+    for flag, diag, recs in _ROOT_CAUSE_TEXT:
+        if flags & flag:
+            diagnosa.append(diag)
+            rekomendasi.extend(recs)
+
+    return tuple(diagnosa), tuple(rekomendasi)
+
+# --- 3. TABEL LAPORAN (HTML) ---
+_TABLE_HEADER = "".join(f"<th>{c}</th>" for c in ("Titik", "DE", "NDE", "Avr", "Zone", "Remark"))
+
+@st.cache_data(show_spinner=False)
+def render_report_table(table):
+    """
+    Tabel Hasil Pengujian sebagai satu string HTML (warna Remark sesuai Zona).
+    table: dict kolom (SoA) {"Titik", "DE", "NDE", "Avr", "Zone", "Remark"} -> array.
+    """
+    body = "".join(
+        f"<tr><td>{titik}</td><td>{de:.2f}</td><td>{nde:.2f}</td><td>{avr:.2f}</td>"
+        f"<td>{zone}</td><td style='{_ZONE_CSS[zone]}'>{remark}</td></tr>"
+        for titik, de, nde, avr, zone, remark in zip(
+            table["Titik"], table["DE"], table["NDE"], table["Avr"], table["Zone"], table["Remark"])
+    )
+    return f"<table style='width:100%'><thead><tr>{_TABLE_HEADER}</tr></thead><tbody>{body}</tbody></table>"
+
+# --- 4. GENERASI LAPORAN ---
+def create_table_row(comp_name, h_de, h_nde, v_de, v_nde, a_de, a_nde, machine_class):
+    """
+    Kolom tabel (SoA) + diagnosa satu unit (Driver/Driven).
+    Return (cols, diagnosa, rekomendasi).
+    """
+    # Baris = sumbu H, V, A; kolom = DE, NDE
+    arr = np.array([[h_de, h_nde], [v_de, v_nde], [a_de, a_nde]])
+
+    # 1. Hitung Average (Sesuai format user)
+    avr = arr.mean(axis=1)
+
+    # 2. Cari Remark & Zone berdasarkan nilai Average
+    # (Jika user ingin remark berdasarkan Max value, ganti avr dengan arr.max(axis=1))
+    zones, remarks, _ = get_iso_zones(avr, machine_class)
+
+    cols = {
+        "Titik": np.array([f"{comp_name} H", f"{comp_name} V", f"{comp_name} A"]),
+        "DE": arr[:, 0], "NDE": arr[:, 1], "Avr": avr, "Zone": zones, "Remark": remarks
+    }
+
+    # 3. Diagnosa Kerusakan (Pakai MAX value agar sensitif)
+    max_h, max_v, max_a = arr.max(axis=1).tolist()
+    diag, rec = analyze_root_cause(max_h, max_v, max_a, _WARNING_THRESHOLDS[machine_class])
+
+    return cols, diag, rec
+
+@st.cache_data(show_spinner=False)
+def _compute_report(machine_class, inputs):
+    """
+    Langkah analisa murni (tanpa widget), di-cache per kombinasi input.
+    inputs: tuple 12 nilai (Driver H/V/A DE-NDE, lalu Driven H/V/A DE-NDE).
+    Return (table, diag_d, rec_d, diag_p, rec_p).
+    """
+    cols_d, diag_d, rec_d = create_table_row("Driver", *inputs[:6], machine_class)
+    cols_p, diag_p, rec_p = create_table_row("Driven", *inputs[6:], machine_class)
+
+    table = {k: np.concatenate([cols_d[k], cols_p[k]]) for k in cols_d}
+    return table, diag_d, rec_d, diag_p, rec_p
+
+# --- 5. APLIKASI UTAMA ---
 def app():
     st.header("⚙️ Inspeksi Mekanikal & Vibrasi (ISO 10816)")
     st.markdown("---")
@@ -90,114 +222,66 @@ def app():
     with col_conf1:
         machine_class = st.selectbox(
             "Klasifikasi Mesin (ISO 10816-3)", 
-            [
-                "Class I (Kecil <15kW)", 
-                "Class II (Medium 15-300kW)", 
-                "Class III (Besar >300kW Rigid)", 
-                "Class IV (Besar Soft)"
-            ], 
+            _MACHINE_CLASSES, 
             index=1,
             help="Pilih Class II untuk pompa standar industri Pertamina."
         )
     
     # Tentukan limit ambang batas Warning (Zona C) untuk trigger diagnosa
-    limits_map = {
-        "Class I (Kecil <15kW)": 1.80,
-        "Class II (Medium 15-300kW)": 2.80, # Batas Kuning ke Oranye
-        "Class III (Besar >300kW Rigid)": 4.50,
-        "Class IV (Besar Soft)": 7.10
-    }
-    warning_threshold = limits_map[machine_class]
+    warning_threshold = _WARNING_THRESHOLDS[machine_class]
 
     with col_conf2:
         st.metric("Batas Alert (Zona C)", f"{warning_threshold} mm/s")
 
     # --- B. INPUT DATA ---
-    st.subheader("Input Data Vibrasi (Velocity RMS)")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.info("🔌 DRIVER (MOTOR)")
-        d_h_de = st.number_input("H - DE (Motor)", 0.00, 50.00, 1.31)
-        d_h_nde = st.number_input("H - NDE (Motor)", 0.00, 50.00, 2.96)
-        st.write("") # Spacer
-        d_v_de = st.number_input("V - DE (Motor)", 0.00, 50.00, 4.49)
-        d_v_nde = st.number_input("V - NDE (Motor)", 0.00, 50.00, 9.80)
-        st.write("")
-        d_a_de = st.number_input("A - DE (Motor)", 0.00, 50.00, 2.24)
-        d_a_nde = st.number_input("A - NDE (Motor)", 0.00, 50.00, 2.50)
-
-    with col2:
-        st.warning("💧 DRIVEN (POMPA)")
-        p_h_de = st.number_input("H - DE (Pompa)", 0.00, 50.00, 3.73)
-        p_h_nde = st.number_input("H - NDE (Pompa)", 0.00, 50.00, 1.80)
-        st.write("")
-        p_v_de = st.number_input("V - DE (Pompa)", 0.00, 50.00, 4.89)
-        p_v_nde = st.number_input("V - NDE (Pompa)", 0.00, 50.00, 1.76)
-        st.write("")
-        p_a_de = st.number_input("A - DE (Pompa)", 0.00, 50.00, 4.13)
-        p_a_nde = st.number_input("A - NDE (Pompa)", 0.00, 50.00, 3.07)
+    # Semua input dalam satu form: edit angka tidak memicu rerun sampai tombol ditekan
+    with st.form("vib_input"):
+        st.subheader("Input Data Vibrasi (Velocity RMS)")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.info("🔌 DRIVER (MOTOR)")
+            d_h_de = st.number_input("H - DE (Motor)", 0.00, 50.00, 1.31)
+            d_h_nde = st.number_input("H - NDE (Motor)", 0.00, 50.00, 2.96)
+            st.write("") # Spacer
+            d_v_de = st.number_input("V - DE (Motor)", 0.00, 50.00, 4.49)
+            d_v_nde = st.number_input("V - NDE (Motor)", 0.00, 50.00, 9.80)
+            st.write("")
+            d_a_de = st.number_input("A - DE (Motor)", 0.00, 50.00, 2.24)
+            d_a_nde = st.number_input("A - NDE (Motor)", 0.00, 50.00, 2.50)
+
+        with col2:
+            st.warning("💧 DRIVEN (POMPA)")
+            p_h_de = st.number_input("H - DE (Pompa)", 0.00, 50.00, 3.73)
+            p_h_nde = st.number_input("H - NDE (Pompa)", 0.00, 50.00, 1.80)
+            st.write("")
+            p_v_de = st.number_input("V - DE (Pompa)", 0.00, 50.00, 4.89)
+            p_v_nde = st.number_input("V - NDE (Pompa)", 0.00, 50.00, 1.76)
+            st.write("")
+            p_a_de = st.number_input("A - DE (Pompa)", 0.00, 50.00, 4.13)
+            p_a_nde = st.number_input("A - NDE (Pompa)", 0.00, 50.00, 3.07)
+
+        submitted = st.form_submit_button("📊 Analisa & Generate Report", type="primary")
 
     # --- C. PROSES ---
-    if st.button("📊 Analisa & Generate Report", type="primary"):
-        
-        # --- LOGIC TABLE GENERATION ---
-        def create_table_row(comp_name, h_de, h_nde, v_de, v_nde, a_de, a_nde):
-            # 1. Hitung Average (Sesuai format user)
-            avg_h = (h_de + h_nde) / 2
-            avg_v = (v_de + v_nde) / 2
-            avg_a = (a_de + a_nde) / 2
-
-            # 2. Cari Remark & Zone berdasarkan nilai Average
-            # (Jika user ingin remark berdasarkan Max value, ganti avg_h dengan max(h_de, h_nde))
-            z_h, rem_h, _ = get_iso_zone(avg_h, machine_class)
-            z_v, rem_v, _ = get_iso_zone(avg_v, machine_class)
-            z_a, rem_a, _ = get_iso_zone(avg_a, machine_class)
-
-            rows = [
-                [f"{comp_name} H", h_de, h_nde, avg_h, z_h, rem_h],
-                [f"{comp_name} V", v_de, v_nde, avg_v, z_v, rem_v],
-                [f"{comp_name} A", a_de, a_nde, avg_a, z_a, rem_a]
-            ]
-            
-            # 3. Diagnosa Kerusakan (Pakai MAX value agar sensitif)
-            max_h, max_v, max_a = max(h_de, h_nde), max(v_de, v_nde), max(a_de, a_nde)
-            diag, rec = analyze_root_cause(max_h, max_v, max_a, warning_threshold)
-            
-            return rows, diag, rec
-
-        # Generate Data
-        rows_d, diag_d, rec_d = create_table_row("Driver", d_h_de, d_h_nde, d_v_de, d_v_nde, d_a_de, d_a_nde)
-        rows_p, diag_p, rec_p = create_table_row("Driven", p_h_de, p_h_nde, p_v_de, p_v_nde, p_a_de, p_a_nde)
-
-        all_rows = rows_d + rows_p
-        df = pd.DataFrame(all_rows, columns=["Titik", "DE", "NDE", "Avr", "Zone", "Remark"])
+    # Input terakhir yang di-submit disimpan di session_state; laporan selalu dihitung
+    # dengan kelas mesin saat ini (_compute_report di-cache, jadi rerun tetap murah)
+    if submitted:
+        st.session_state["mech_inputs"] = (
+            d_h_de, d_h_nde, d_v_de, d_v_nde, d_a_de, d_a_nde,
+            p_h_de, p_h_nde, p_v_de, p_v_nde, p_a_de, p_a_nde,
+        )
+    inputs = st.session_state.get("mech_inputs")
+
+    if inputs:
+        table, diag_d, rec_d, diag_p, rec_p = _compute_report(machine_class, inputs)
 
         # --- D. TAMPILAN OUTPUT ---
         st.divider()
         st.subheader("1. Tabel Hasil Pengujian")
 
-        # Styling Function untuk Pandas (Highlighting Background)
-        def highlight_remark(val):
-            val_lower = str(val).lower()
-            if "damage" in val_lower: # Merah (Zone D)
-                return 'background-color: #ff4b4b; color: white; font-weight: bold;'
-            elif "short-term" in val_lower: # Oranye (Zone C)
-                return 'background-color: #ffa500; color: black; font-weight: bold;'
-            elif "unlimited" in val_lower: # Kuning (Zone B)
-                return 'background-color: #ffd700; color: black; font-weight: bold;'
-            elif "new machine" in val_lower: # Hijau (Zone A)
-                return 'background-color: #90ee90; color: black; font-weight: bold;'
-            return ''
-
-        # Render Tabel dengan Style
-        st.dataframe(
-            df.style.applymap(highlight_remark, subset=['Remark'])
-                    .format("{:.2f}", subset=['DE', 'NDE', 'Avr']),
-            use_container_width=True,
-            hide_index=True,
-            height=300
-        )
+        # Render Tabel dengan Style (warna Remark diambil langsung dari kolom Zone)
+        st.markdown(render_report_table(table), unsafe_allow_html=True)
 
         st.subheader("2. Diagnosa & Rekomendasi Teknis")
         
@@ -206,23 +290,21 @@ def app():
         # Display Diagnosa Driver
         with c_diag1:
             st.markdown("#### ⚡ Driver (Motor)")
-            if "Normal" in diag_d[0]:
+            if diag_d == _NORMAL_DIAG:
                 st.success("✅ Kondisi Mekanikal Baik")
             else:
                 for d in diag_d:
                     st.error(f"⚠️ **{d}**")
                 with st.expander("Lihat Rekomendasi Perbaikan", expanded=True):
-                    for r in rec_d:
-                        st.markdown(f"- {r}")
+                    st.markdown("\n".join(f"- {r}" for r in rec_d))
 
         # Display Diagnosa Driven
         with c_diag2:
             st.markdown("#### 💧 Driven (Pompa)")
-            if "Normal" in diag_p[0]:
+            if diag_p == _NORMAL_DIAG:
                 st.success("✅ Kondisi Mekanikal Baik")
             else:
                 for d in diag_p:
                     st.error(f"⚠️ **{d}**")
                 with st.expander("Lihat Rekomendasi Perbaikan", expanded=True):
-                    for r in rec_p:
-                        st.markdown(f"- {r}")
+                    st.markdown("\n".join(f"- {r}" for r in rec_p))
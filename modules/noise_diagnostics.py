@@ -1,18 +1,65 @@
-from typing import List
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, Tuple
+
+# --- KOSAKATA INPUT (sumber tunggal untuk UI & rule; dibandingkan langsung dengan ==) ---
+NOISE_NORMAL = "Normal (Humming)"
+NOISE_POPPING = "Suara Kerikil/Letupan (Popping)"
+NOISE_GROWLING = "Ngorok/Kasar (Growling)"
+NOISE_SQUEALING = "Mencicit (Squealing)"
+NOISE_RUMBLING = "Gemuruh (Rumbling)"
+NOISE_SCRAPING = "Gesekan Logam (Scraping)"
+NOISE_TYPES = (NOISE_NORMAL, NOISE_POPPING, NOISE_GROWLING, NOISE_SQUEALING, NOISE_RUMBLING)
+
+NOISE_LOCATIONS = ("-", "Motor DE", "Motor NDE", "Pump DE", "Pump NDE", "Casing")
+
+VALVE_NOT_TESTED = "Tidak Dilakukan"
+VALVE_STABLE = "Suara Stabil"
+VALVE_RECIRCULATION = "Suara Berubah Drastis (Recirculation)"
+VALVE_TESTS = (VALVE_NOT_TESTED, VALVE_STABLE, VALVE_RECIRCULATION)
+
+# --- ID DIAGNOSA: hasil analisa disimpan sebagai id kecil, teks hanya saat render ---
+class NoiseDiag(IntEnum):
+    BEARING_DEFECT = 0
+    LUBRICATION = 1
+    RUBBING = 2
+    CAVITATION = 3
+    RECIRCULATION = 4
+
+_MSG_TABLE = (
+    "🔊 BEARING DEFECT: Suara ngorok. Ganti Bearing.",
+    "🔊 LUBRICATION ISSUE: Kurang pelumas. Regreasing.",
+    "🔊 RUBBING: Gesekan poros.",
+    "🔊 KAVITASI: Suara kerikil. Cek Strainer/Level Tangki.",
+    "🌊 FLOW RECIRCULATION: Flow minimum. Buka valve discharge.",
+)
+
+# --- RULE NOISE: jenis suara -> diagnosa (dibangun sekali saat import) ---
+_NOISE_RULES = {
+    NOISE_GROWLING: NoiseDiag.BEARING_DEFECT,
+    NOISE_SQUEALING: NoiseDiag.LUBRICATION,
+    NOISE_SCRAPING: NoiseDiag.RUBBING,
+}
+
+# Rule gabungan: (predikat(noise_type, noise_loc, valve_test), diagnosa)
+_COMPOUND_RULES = (
+    (lambda nt, nl, vt: nt == NOISE_POPPING or "Casing" in nl, NoiseDiag.CAVITATION),
+    (lambda nt, nl, vt: vt == VALVE_RECIRCULATION or nt == NOISE_RUMBLING, NoiseDiag.RECIRCULATION),
+)
+
+def noise_messages(ids) -> List[str]:
+    """id diagnosa -> teks pesan (untuk tampilan/laporan)."""
+    return [_MSG_TABLE[i] for i in ids]
 
 def analyze_noise_profile(noise_type: str, noise_loc: str, valve_test: str) -> List[str]:
+    return noise_messages(analyze_noise_ids(noise_type, noise_loc, valve_test))
+
+@lru_cache(maxsize=256)
+def analyze_noise_ids(noise_type: str, noise_loc: str, valve_test: str) -> Tuple[NoiseDiag, ...]:
+    """Seperti analyze_noise_profile, tapi return tuple NoiseDiag (immutable, di-cache)."""
     diagnosa = []
-    if noise_type == "Ngorok/Kasar (Growling)":
-        diagnosa.append("🔊 BEARING DEFECT: Suara ngorok. Ganti Bearing.")
-    elif noise_type == "Mencicit (Squealing)":
-        diagnosa.append("🔊 LUBRICATION ISSUE: Kurang pelumas. Regreasing.")
-    elif noise_type == "Gesekan Logam (Scraping)":
-        diagnosa.append("🔊 RUBBING: Gesekan poros.")
-    
-    if noise_type == "Suara Kerikil/Letupan (Popping)" or "Casing" in noise_loc:
-        diagnosa.append("🔊 KAVITASI: Suara kerikil. Cek Strainer/Level Tangki.")
-
-    if valve_test == "Suara Berubah Drastis (Recirculation)" or noise_type == "Gemuruh (Rumbling)":
-        diagnosa.append("🌊 FLOW RECIRCULATION: Flow minimum. Buka valve discharge.")
-    
-    return diagnosa
+    diag = _NOISE_RULES.get(noise_type)
+    if diag is not None: diagnosa.append(diag)
+
+    diagnosa.extend(diag for pred, diag in _COMPOUND_RULES if pred(noise_type, noise_loc, valve_test))
+    return tuple(diagnosa)
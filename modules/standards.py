@@ -1,4 +1,7 @@
 from enum import Enum
+from typing import Final
+
+__all__ = ["ISOZone", "Limits"]
 
 class ISOZone(Enum):
     """
@@ -13,14 +16,15 @@ class ISOZone(Enum):
 class Limits:
     """
     Database Limit Standar (Bisa di-override oleh database aset)
+    Konstanta level kelas (Final), tidak perlu di-instansiasi.
     """
     # Electrical Limits (NEMA/ANSI)
-    VOLT_UNBALANCE_LIMIT = 3.0
-    CURR_UNBALANCE_LIMIT = 10.0
+    VOLT_UNBALANCE_LIMIT: Final[float] = 3.0
+    CURR_UNBALANCE_LIMIT: Final[float] = 10.0
     
     # Mechanical Limits Default (ISO 10816 Rigid)
-    VIB_WARN_DEFAULT = 2.80  # Batas Zone B ke C
-    VIB_TRIP_DEFAULT = 7.10  # Batas Zone C ke D
+    VIB_WARN_DEFAULT: Final[float] = 2.80  # Batas Zone B ke C
+    VIB_TRIP_DEFAULT: Final[float] = 7.10  # Batas Zone C ke D
     
     # Temperature Limits
-    TEMP_BEARING_STD = 85.0
+    TEMP_BEARING_STD: Final[float] = 85.0
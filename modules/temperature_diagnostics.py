@@ -1,19 +1,42 @@
-from typing import List, Dict
+import re
+from functools import lru_cache
+from typing import List, Dict, Tuple
+
+from .noise_diagnostics import NOISE_SQUEALING, NOISE_GROWLING
+
+# Keyword lokasi yang dipakai rule; satu pola gabungan (lookahead agar tumpang tindih tetap terdeteksi)
+_LOC_KEYWORDS = ("DE", "Pump", "Seal")
+_LOC_MATCHER = re.compile("(?=(%s))" % "|".join(map(re.escape, _LOC_KEYWORDS)))
+
+@lru_cache(maxsize=64)
+def _loc_tags(loc: str) -> frozenset:
+    """'Pump DE' -> {'Pump', 'DE'} (satu scan, di-cache per nama lokasi)"""
+    return frozenset(m.group(1) for m in _LOC_MATCHER.finditer(loc))
 
 def analyze_temperature_profile(temps: Dict[str, float], limit_warn: float, noise_type: str, vib_axial_high: bool) -> List[str]:
+    # temps di-freeze jadi tuple (urutan lokasi tetap) agar bisa jadi key cache
+    return list(_temperature_cached(tuple(temps.items()), limit_warn, noise_type, vib_axial_high))
+
+@lru_cache(maxsize=512)
+def _temperature_cached(temps: Tuple[Tuple[str, float], ...], limit_warn: float, noise_type: str, vib_axial_high: bool) -> Tuple[str, ...]:
     diagnosa = []
-    overheat = {loc: val for loc, val in temps.items() if val > limit_warn}
-    
-    for loc, val in overheat.items():
+    # Cek noise tidak bergantung lokasi -> dihitung sekali di luar loop
+    is_squealing = noise_type == NOISE_SQUEALING
+    is_growling = noise_type == NOISE_GROWLING
+
+    for loc, val in temps:
+        if val <= limit_warn: continue
         msg = f"🔥 OVERHEAT {loc} ({val}°C)."
-        if noise_type == "Mencicit (Squealing)":
+        tags = _loc_tags(loc)
+        if is_squealing:
             diagnosa.append(f"{msg} SEBAB: Kurang Grease.")
-        elif "DE" in loc and vib_axial_high:
+        elif vib_axial_high and "DE" in tags:
             diagnosa.append(f"{msg} SEBAB: Misalignment.")
-        elif noise_type == "Ngorok/Kasar (Growling)":
+        elif is_growling:
             diagnosa.append(f"{msg} SEBAB: Bearing Rusak.")
-        elif "Pump" in loc and "Seal" in loc:
+        elif "Pump" in tags and "Seal" in tags:
              diagnosa.append(f"{msg} SEBAB: Gland Packing Kencang/Seal Flush Buntu.")
         else:
             diagnosa.append(f"{msg} ACTION: Cek Fisik.")
-    return list(set(diagnosa))
+    # Tiap pesan memuat nama lokasi (key dict unik) -> tidak mungkin duplikat
+    return tuple(diagnosa)
@@ -1,9 +1,70 @@
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
 # --- STANDAR REFERENSI ---
 # ISO 20816-3: Mechanical vibration - Measurement and evaluation (Group 2 Machines)
 # API 610: Centrifugal Pumps (Vibration Limits)
 
+# --- SUSUNAN TITIK UKUR: baris = unit (Driver, Driven), kolom = sumbu (H, V, A) ---
+_DE_KEYS = (("m_de_h", "m_de_v", "m_de_a"), ("p_de_h", "p_de_v", "p_de_a"))
+_NDE_KEYS = (("m_nde_h", "m_nde_v", "m_nde_a"), ("p_nde_h", "p_nde_v", "p_nde_a"))
+# Urutan 12 kolom input batch -> reshape (N, unit, DE/NDE, sumbu)
+_BATCH_COLUMNS = tuple(k for de_row, nde_row in zip(_DE_KEYS, _NDE_KEYS) for k in de_row + nde_row)
+# Kolom Unit/Axis tabel laporan (urutan = avr.ravel())
+_REPORT_UNITS = ("Driver",) * 3 + ("Driven",) * 3
+_REPORT_AXES = ("H", "V", "A") * 2
+
+# Remark per indeks zona (0=A .. 3=D)
+_ZONE_REMARKS = (
+    "ZONE A: New machine condition",
+    "ZONE B: Unlimited long-term operation",
+    "ZONE C: Short-term operation allowable",
+    "ZONE D: Vibration causes damage",
+)
+# --- RULE DIAGNOSA (ISO 13373-1) ---
+# Indeks array Avr (..., unit, sumbu): berlaku untuk satu mesin (2,3) maupun batch (N,2,3)
+_DRIVER, _DRIVEN = 0, 1
+_H, _V, _A = 0, 1, 2
+
+def _rule_misalignment(avr, warn, trip):
+    # 1. MISALIGNMENT (Dominan Axial & 2X RPM): Axial > 50% dari vibrasi tertinggi radial
+    axial = avr[..., _A].max(axis=-1)
+    radial = avr[..., [_H, _V]].max(axis=(-2, -1))
+    return (axial > warn) & (axial > 0.5 * radial)
+
+def _rule_unbalance(avr, warn, trip):
+    # 2. UNBALANCE (Dominan Radial 1X RPM, biasanya Horizontal): Horizontal tinggi, Axial rendah
+    return (avr[..., _H].max(axis=-1) > warn) & (avr[..., _A].max(axis=-1) < warn)
+
+def _rule_looseness(avr, warn, trip):
+    # 3. MECHANICAL LOOSENESS / SOFT FOOT (Dominan Vertical): Vertical Driver jauh lebih tinggi dari Horizontal
+    driver_v = avr[..., _DRIVER, _V]
+    return (driver_v > 1.5 * avr[..., _DRIVER, _H]) & (driver_v > warn)
+
+def _rule_bent_shaft(avr, warn, trip):
+    # 4. BENT SHAFT (Axial tinggi di kedua sisi; beda fase 180 sulit dideteksi tanpa phase)
+    return (avr[..., _DRIVER, _A] > trip) & (avr[..., _DRIVEN, _A] > trip)
+
+# (rule(avr, warn, trip), pesan), urutan = urutan tampil
+_CAUSE_RULES = (
+    (_rule_misalignment, "MISALIGNMENT: Vibrasi Axial Dominan. Cek Kopling & Alignment."),
+    (_rule_unbalance, "UNBALANCE: Vibrasi Radial (Horiz) Dominan. Cek Kotoran di Kipas/Impeller."),
+    (_rule_looseness, "LOOSENESS / SOFT FOOT: Vibrasi Vertical Dominan. Cek Baut Pondasi."),
+    (_rule_bent_shaft, "BENT SHAFT (Indikasi): Vibrasi Axial Tinggi di kedua sisi."),
+)
+# Status & warna global per indeks zona (0=A .. 3=D)
+_GLOBAL_STATUS = ("ZONE A: NEW CONDITION", "ZONE B: Unlimited", "ZONE C: WARNING", "ZONE D: DAMAGE")
+_GLOBAL_COLOR = ("#2ecc71", "#a3e048", "#f1c40f", "#e74c3c")
+
+@dataclass(slots=True, frozen=True)
+class VibPoint:
+    """Satu titik ukur vibrasi (mis. "Motor DE", "Horizontal", 1.2 mm/s)."""
+    location: str
+    axis: str
+    value: float
+
 class VibrationAnalyzer:
     def __init__(self, limit_warn=4.5, limit_trip=7.1, is_new_machine=False):
         """
@@ -18,117 +79,70 @@ class VibrationAnalyzer:
         # Atau bisa diset manual jika ada data commissioning (misal 2.3 mm/s)
         self.limit_zone_a = 2.30 if limit_warn >= 4.0 else (limit_warn * 0.6)
 
+        # Batas zona terurut untuk klasifikasi vektor (searchsorted)
+        self._thr = np.array([self.limit_zone_a, self.limit_warn, self.limit_trip])
+
     def determine_zone(self, value):
         """
         Menentukan Zone (A/B/C/D) sesuai ISO 20816
         """
-        if value < self.limit_zone_a:
-            return "ZONE A: New machine condition"
-        elif value < self.limit_warn:
-            return "ZONE B: Unlimited long-term operation"
-        elif value < self.limit_trip:
-            return "ZONE C: Short-term operation allowable"
-        else:
-            return "ZONE D: Vibration causes damage"
-
-    def calculate_average(self, val1, val2):
-        """Hitung Rata-rata 2 titik (DE & NDE) per sumbu"""
-        return (val1 + val2) / 2
-
-    def diagnose_root_cause(self, df_report):
+        # Batas zona satu sumber (self._thr), sama dengan zone_indices
+        return _ZONE_REMARKS[int(self.zone_indices(value))]
+
+    def zone_indices(self, values):
+        """Indeks zona (0=A .. 3=D) untuk banyak nilai sekaligus."""
+        # side='right': nilai tepat di batas masuk zona berikutnya (value < limit)
+        return np.searchsorted(self._thr, values, side='right')
+
+    def diagnose_root_cause(self, avr):
         """
         Logika Diagnosa Cerdas (Heuristic) berdasarkan Pola Vibrasi.
-        Input: DataFrame hasil olahan.
+        Input: array rata-rata per sumbu, urutan [M-H, M-V, M-A, P-H, P-V, P-A]
+        (boleh bentuk (2,3) seperti di generate_full_report).
         Output: List kemungkinan penyebab.
         """
-        causes = []
-        max_val = df_report['Avr'].max()
-        
+        avr = np.asarray(avr, dtype=float).reshape(2, 3)
+
         # Jika vibrasi masih aman (Zone A/B), tidak perlu diagnosa
-        if max_val < self.limit_warn:
+        if avr.max() < self.limit_warn:
             return []
 
-        # Ambil nilai rata-rata per sumbu untuk logika
-        # Filter berdasarkan Unit (Driver/Driven) dan Axis
-        try:
-            m_h = df_report[(df_report['Unit']=='Driver') & (df_report['Axis']=='H')]['Avr'].values[0]
-            m_v = df_report[(df_report['Unit']=='Driver') & (df_report['Axis']=='V')]['Avr'].values[0]
-            m_a = df_report[(df_report['Unit']=='Driver') & (df_report['Axis']=='A')]['Avr'].values[0]
-            
-            p_h = df_report[(df_report['Unit']=='Driven') & (df_report['Axis']=='H')]['Avr'].values[0]
-            p_v = df_report[(df_report['Unit']=='Driven') & (df_report['Axis']=='V')]['Avr'].values[0]
-            p_a = df_report[(df_report['Unit']=='Driven') & (df_report['Axis']=='A')]['Avr'].values[0]
-        except:
-            return ["Data tidak lengkap untuk diagnosa otomatis"]
-
-        # --- LOGIC MATRIX (ISO 13373-1) ---
-        
-        # 1. MISALIGNMENT (Dominan Axial & 2X RPM)
-        # Jika Axial > 50% dari vibrasi tertinggi radial
-        max_radial = max(m_h, m_v, p_h, p_v)
-        if (m_a > self.limit_warn or p_a > self.limit_warn) and (max(m_a, p_a) > 0.5 * max_radial):
-            causes.append("MISALIGNMENT: Vibrasi Axial Dominan. Cek Kopling & Alignment.")
-
-        # 2. UNBALANCE (Dominan Radial 1X RPM, biasanya Horizontal)
-        # Jika Horizontal tinggi, tapi Axial rendah
-        if (m_h > self.limit_warn or p_h > self.limit_warn) and (max(m_a, p_a) < self.limit_warn):
-            causes.append("UNBALANCE: Vibrasi Radial (Horiz) Dominan. Cek Kotoran di Kipas/Impeller.")
-
-        # 3. MECHANICAL LOOSENESS / SOFT FOOT (Dominan Vertical)
-        # Jika Vertical jauh lebih tinggi dari Horizontal (pada mesin horizontal)
-        if (m_v > 1.5 * m_h) and (m_v > self.limit_warn):
-            causes.append("LOOSENESS / SOFT FOOT: Vibrasi Vertical Dominan. Cek Baut Pondasi.")
-        
-        # 4. BENT SHAFT (Axial tinggi dengan beda fase 180 - sulit deteksi tanpa phase, tapi indikasi mirip misalignment)
-        if (m_a > self.limit_trip) and (p_a > self.limit_trip):
-             causes.append("BENT SHAFT (Indikasi): Vibrasi Axial Tinggi di kedua sisi.")
-
-        return causes
+        # --- LOGIC MATRIX (ISO 13373-1), lihat _CAUSE_RULES ---
+        return [msg for rule, msg in _CAUSE_RULES if rule(avr, self.limit_warn, self.limit_trip)]
 
     def generate_full_report(self, inputs):
         """
         Fungsi Utama untuk generate Data Laporan.
         inputs: Dictionary berisi m_de_h, m_nde_h, dst.
         """
-        # 1. Hitung Rata-rata per Sumbu (Driver)
-        avr_m_h = self.calculate_average(inputs['m_de_h'], inputs['m_nde_h'])
-        avr_m_v = self.calculate_average(inputs['m_de_v'], inputs['m_nde_v'])
-        avr_m_a = self.calculate_average(inputs['m_de_a'], inputs['m_nde_a'])
-
-        # 2. Hitung Rata-rata per Sumbu (Driven)
-        avr_p_h = self.calculate_average(inputs['p_de_h'], inputs['p_nde_h'])
-        avr_p_v = self.calculate_average(inputs['p_de_v'], inputs['p_nde_v'])
-        avr_p_a = self.calculate_average(inputs['p_de_a'], inputs['p_nde_a'])
-
-        # 3. Buat Data Table (Sesuai Format Laporan Perusahaan)
-        data = [
-            ["Driver", "H", inputs['m_de_h'], inputs['m_nde_h'], avr_m_h, self.limit_warn, self.determine_zone(avr_m_h)],
-            ["Driver", "V", inputs['m_de_v'], inputs['m_nde_v'], avr_m_v, self.limit_warn, self.determine_zone(avr_m_v)],
-            ["Driver", "A", inputs['m_de_a'], inputs['m_nde_a'], avr_m_a, self.limit_warn, self.determine_zone(avr_m_a)],
-            ["Driven", "H", inputs['p_de_h'], inputs['p_nde_h'], avr_p_h, self.limit_warn, self.determine_zone(avr_p_h)],
-            ["Driven", "V", inputs['p_de_v'], inputs['p_nde_v'], avr_p_v, self.limit_warn, self.determine_zone(avr_p_v)],
-            ["Driven", "A", inputs['p_de_a'], inputs['p_nde_a'], avr_p_a, self.limit_warn, self.determine_zone(avr_p_a)],
-        ]
-        
-        df = pd.DataFrame(data, columns=["Unit", "Axis", "DE", "NDE", "Avr", "Limit", "Remark"])
-
-        # 4. Generate Diagnosa & Status Global
-        causes = self.diagnose_root_cause(df)
-        max_val = max(avr_m_h, avr_m_v, avr_m_a, avr_p_h, avr_p_v, avr_p_a)
+        # 1. Susun input jadi array (2,3) lalu rata-rata DE & NDE per sumbu sekaligus
+        de = np.array([[inputs[k] for k in row] for row in _DE_KEYS], dtype=float)
+        nde = np.array([[inputs[k] for k in row] for row in _NDE_KEYS], dtype=float)
+        avr = (de + nde) * 0.5
+        avr_flat = avr.ravel()
+        zone_idx = self.zone_indices(avr_flat)
+
+        # 2. Buat Data Table (Sesuai Format Laporan Perusahaan), dibangun per kolom
+        df = pd.DataFrame({
+            "Unit": _REPORT_UNITS,
+            "Axis": _REPORT_AXES,
+            "DE": de.ravel(),
+            "NDE": nde.ravel(),
+            "Avr": avr_flat,
+            "Limit": self.limit_warn,
+            "Remark": [_ZONE_REMARKS[i] for i in zone_idx.tolist()],
+        })
+
+        # 3. Generate Diagnosa & Status Global
+        causes = self.diagnose_root_cause(avr)
+        max_val = float(avr_flat.max())
         
-        # Tentukan Status Global (Untuk Gauge & Header)
-        status_global = "ZONE B: Unlimited"
-        remark_list = df['Remark'].tolist()
-        
-        if any("ZONE D" in x for x in remark_list): status_global = "ZONE D: DAMAGE"
-        elif any("ZONE C" in x for x in remark_list): status_global = "ZONE C: WARNING"
-        elif any("ZONE A" in x for x in remark_list): status_global = "ZONE A: NEW CONDITION" # Priority if mostly good
-
-        # Tentukan Warna Global
-        color_global = "#a3e048" # Zone B
-        if "ZONE D" in status_global: color_global = "#e74c3c"
-        if "ZONE C" in status_global: color_global = "#f1c40f"
-        if "ZONE A" in status_global: color_global = "#2ecc71"
+        # Tentukan Status & Warna Global (Untuk Gauge & Header)
+        # Prioritas: D > C > A (jika ada titik Zone A dan tidak ada C/D) > B
+        global_idx = int(zone_idx.max())
+        if global_idx < 2 and zone_idx.min() == 0: global_idx = 0
+        status_global = _GLOBAL_STATUS[global_idx]
+        color_global = _GLOBAL_COLOR[global_idx]
 
         return {
             "dataframe": df,
@@ -137,3 +151,59 @@ class VibrationAnalyzer:
             "global_color": color_global,
             "causes": causes
         }
+
+    def generate_full_report_batch(self, inputs):
+        """
+        Versi batch generate_full_report untuk banyak mesin sekaligus (survey harian).
+        inputs: DataFrame dengan 12 kolom m_de_h .. p_nde_a, atau array (N, 12) dengan urutan _BATCH_COLUMNS.
+        Return dict array per mesin (tanpa DataFrame per mesin).
+        """
+        if hasattr(inputs, "columns"): inputs = inputs[list(_BATCH_COLUMNS)]
+        # (mesin, unit, DE/NDE, sumbu)
+        arr = np.asarray(inputs, dtype=float).reshape(-1, 2, 2, 3)
+        avr = (arr[:, :, 0] + arr[:, :, 1]) * 0.5  # (N, 2, 3)
+        n = avr.shape[0]
+
+        zone_idx = self.zone_indices(avr.reshape(-1)).reshape(n, 6)
+        global_idx = zone_idx.max(axis=1)
+        global_idx = np.where((global_idx < 2) & (zone_idx.min(axis=1) == 0), 0, global_idx)
+
+        # Rule diagnosa yang sama (_CAUSE_RULES) dievaluasi sebagai mask boolean per mesin
+        masks = np.column_stack([rule(avr, self.limit_warn, self.limit_trip) for rule, _ in _CAUSE_RULES])
+        max_val = avr.max(axis=(1, 2))
+        masks &= (max_val >= self.limit_warn)[:, None]
+
+        return {
+            "average": avr,
+            "zone_index": zone_idx,
+            "max_value": max_val,
+            "global_status": [_GLOBAL_STATUS[i] for i in global_idx.tolist()],
+            "global_color": [_GLOBAL_COLOR[i] for i in global_idx.tolist()],
+            "causes": [[msg for (_, msg), hit in zip(_CAUSE_RULES, row) if hit] for row in masks.tolist()],
+        }
+
+# --- MATRIX VIBPOINT (Commissioning): lokasi -> unit, huruf awal sumbu -> kolom ---
+_POINT_UNIT = {"Motor": _DRIVER, "Pump": _DRIVEN}
+_POINT_AXIS = {"H": _H, "V": _V, "A": _A}
+
+def analyze_vibration_matrix(readings, limit_warn, limit_trip=7.1):
+    """
+    Diagnosa dari list VibPoint (mis. "Motor DE", "Horizontal", 1.2).
+    DE & NDE dirata-rata per unit/sumbu lalu dievaluasi dengan _CAUSE_RULES.
+    Return list pesan penyebab.
+    """
+    analyzer = VibrationAnalyzer(limit_warn=limit_warn, limit_trip=limit_trip)
+
+    total = np.zeros((2, 3))
+    count = np.zeros((2, 3))
+    for r in readings:
+        pos = (_POINT_UNIT[r.location.split(" ", 1)[0]], _POINT_AXIS[r.axis[0]])
+        total[pos] += r.value
+        count[pos] += 1
+    causes = analyzer.diagnose_root_cause(total / np.maximum(count, 1))
+    if causes: return causes
+
+    # Tanpa pola spesifik: laporkan titik yang sudah masuk Zone C/D
+    zone_idx = analyzer.zone_indices([r.value for r in readings]).tolist()
+    return [f"VIBRASI TINGGI: {r.location} {r.axis} {r.value:.2f} mm/s ({_ZONE_REMARKS[z]})"
+            for r, z in zip(readings, zone_idx) if z >= 2]
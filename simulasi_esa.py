@@ -11,12 +11,43 @@ from modules.standards import ISOZone
 from modules.electrical_diagnostics import analyze_electrical_health
 from modules.health_logic import assess_overall_health
 
+# --- STYLE TABEL: prefix Remark ("ZONE X") -> CSS baris ---
+_ROW_CSS = {
+    "ZONE D": 'background-color: #ffebee; color: #b71c1c',                     # Merah Muda Pucat (Soft Red) - Untuk Bahaya
+    "ZONE C": 'background-color: #fffde7; color: #f57f17',                     # Krem/Kuning Mentega (Soft Yellow) - Untuk Warning
+    "ZONE A": 'background-color: #e8f5e9; color: #1b5e20; font-weight: bold', # Hijau Mint Sangat Muda (Soft Green) - Untuk New Machine
+}
+_ROW_CSS_DEFAULT = 'background-color: #ffffff; color: #212529'                 # Putih Bersih - Untuk Normal (Zone B)
+
+# --- ANALISA VIBRASI (di-cache: rerun dengan input sama tidak dihitung ulang) ---
+@st.cache_data(max_entries=128, show_spinner=False)
+def _vib_report(limit_warn, limit_trip, inputs):
+    """inputs: tuple (key, nilai) agar hashable; return dict hasil generate_full_report."""
+    return VibrationAnalyzer(limit_warn=limit_warn, limit_trip=limit_trip).generate_full_report(dict(inputs))
+
+@st.cache_resource(max_entries=64)
+def _max_avr_gauge(value, color):
+    """Gauge Max Avr (objek Plotly di-cache per nilai & warna zona, dipakai ulang antar rerun)."""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number", value=value,
+        title={'text': "Max Avr"},
+        gauge={'axis': {'range': [0, 10]}, 'bar': {'color': "black"}, 'steps': [{'range': [0, 10], 'color': color}]}
+    ))
+    fig.update_layout(height=180, margin=dict(t=30,b=20,l=20,r=20))
+    return fig
+
+# Checklist temuan fisik (label checkbox = teks temuan)
+_PHYS_CHECKLIST = ("MAJOR: Seal Bocor", "MAJOR: Guard Hilang", "MINOR: Baut Kendor")
+
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Reliability Pro - ISO 20816", layout="wide")
 
 # --- SESSION STATE INIT ---
-if 'mech_result' not in st.session_state: st.session_state.mech_result = None
-if 'elec_result' not in st.session_state: st.session_state.elec_result = None
+_STATE_DEFAULTS = {'mech_result': None, 'elec_result': None}
+# Inisialisasi sekali per sesi (satu sentinel, bukan cek per key tiap rerun)
+if '_sim_initialized' not in st.session_state:
+    st.session_state.update(_STATE_DEFAULTS)
+    st.session_state['_sim_initialized'] = True
 
 # --- SIDEBAR ---
 with st.sidebar:
@@ -40,8 +71,10 @@ tab1, tab2, tab3, tab4 = st.tabs(["⚙️ MEKANIKAL", "⚡ ELEKTRIKAL", "🏥 KE
 
 # ==============================================================================
 # TAB 1: MEKANIKAL (CLEAN CODE VERSION)
+# Fragment: submit form mekanikal hanya me-rerun tab ini (sidebar & tab lain tidak dieksekusi ulang)
 # ==============================================================================
-with tab1:
+@st.fragment
+def _mech_tab():
     col1, col2 = st.columns([1, 1.5]) 
     
     # --- FORM INPUT ---
@@ -82,9 +115,7 @@ with tab1:
             st.divider()
             # Input Fisik & Noise
             noise = st.selectbox("Noise:", ["Normal", "Kavitasi", "Bearing Defect", "Recirculation"])
-            chk_seal = st.checkbox("MAJOR: Seal Bocor")
-            chk_guard = st.checkbox("MAJOR: Guard Hilang")
-            chk_baut = st.checkbox("MINOR: Baut Kendor")
+            phys_checks = [(finding, st.checkbox(finding)) for finding in _PHYS_CHECKLIST]
             
             submit_mech = st.form_submit_button("🔍 GENERATE TABEL LAPORAN")
 
@@ -98,19 +129,15 @@ with tab1:
             'p_nde_h': p_nde_h, 'p_nde_v': p_nde_v, 'p_nde_a': p_nde_a
         }
         
-        # 2. Inisialisasi Analyzer dari Module Baru
+        # 2. Limit Analyzer sesuai aktivitas
         limit_val = 4.50 if is_comm else asset.vib_limit_warning
-        analyzer = VibrationAnalyzer(limit_warn=limit_val, limit_trip=7.1)
         
-        # 3. Minta Module untuk Menganalisa & Membuat Laporan
-        vib_result = analyzer.generate_full_report(inputs)
+        # 3. Minta Module untuk Menganalisa & Membuat Laporan (hasil di-cache per input)
+        vib_result = _vib_report(limit_val, 7.1, tuple(inputs.items()))
 
         # 4. Simpan ke Session State (Ditambah data fisik/suhu yg tidak masuk modul vib)
         temps = {"Motor": max(t_m_de, t_m_nde), "Pump": max(t_p_de, t_p_nde)}
-        phys_list = []
-        if chk_seal: phys_list.append("MAJOR: Seal Bocor")
-        if chk_guard: phys_list.append("MAJOR: Guard Hilang")
-        if chk_baut: phys_list.append("MINOR: Baut Kendor")
+        phys_list = [finding for finding, checked in phys_checks if checked]
         
         st.session_state.mech_result = {
             "df": vib_result['dataframe'],
@@ -131,18 +158,7 @@ with tab1:
             
 # Styling Tabel (Warna Soft Pastel - Anti Silau)
             def highlight_row(row):
-                if "ZONE D" in row['Remark']: 
-                    # Merah Muda Pucat (Soft Red) - Untuk Bahaya
-                    return ['background-color: #ffebee; color: #b71c1c']*len(row) 
-                elif "ZONE C" in row['Remark']: 
-                    # Krem/Kuning Mentega (Soft Yellow) - Untuk Warning
-                    return ['background-color: #fffde7; color: #f57f17']*len(row) 
-                elif "ZONE A" in row['Remark']: 
-                    # Hijau Mint Sangat Muda (Soft Green) - Untuk New Machine
-                    return ['background-color: #e8f5e9; color: #1b5e20; font-weight: bold']*len(row) 
-                else: 
-                    # Putih Bersih - Untuk Normal (Zone B)
-                    return ['background-color: #ffffff; color: #212529']*len(row)
+                return [_ROW_CSS.get(row['Remark'][:6], _ROW_CSS_DEFAULT)] * len(row)
 
             st.dataframe(
                 res['df'].style.apply(highlight_row, axis=1).format({"DE": "{:.2f}", "NDE": "{:.2f}", "Avr": "{:.2f}", "Limit": "{:.2f}"}), 
@@ -152,26 +168,23 @@ with tab1:
             
             c_g1, c_g2 = st.columns([1, 2])
             with c_g1:
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number", value=res['max_val'],
-                    title={'text': "Max Avr"},
-                    gauge={'axis': {'range': [0, 10]}, 'bar': {'color': "black"}, 'steps': [{'range': [0, 10], 'color': res['color']}]}
-                ))
-                fig.update_layout(height=180, margin=dict(t=30,b=20,l=20,r=20))
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_max_avr_gauge(res['max_val'], res['color']), use_container_width=True)
             
             with c_g2:
                 st.info(f"**STATUS UNIT: {res['status']}**")
                 
                 if res['causes']:
                     st.error("🚨 **DIAGNOSA PENYEBAB (Vibrasi):**")
-                    for c in res['causes']: st.write(f"• {c}")
+                    st.markdown("\n".join(f"- {c}" for c in res['causes']))
                 else:
                     st.success("✅ Pola vibrasi Normal (Tidak ada diagnosa spesifik).")
                     
                 if res['phys']:
                     st.warning("⚠️ Temuan Fisik: " + ", ".join(res['phys']))
 
+with tab1:
+    _mech_tab()
+
 # ==============================================================================
 # TAB 2: ELEKTRIKAL (Copy Paste Kode Lama Anda Di Sini)
 # ==============================================================================
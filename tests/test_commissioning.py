@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from modules.standards import ISOZone
+
+_PAGE = str(Path(__file__).resolve().parent.parent / "Commissioning.py")
+
+
+def _click(at, label):
+    next(b for b in at.button if b.label == label).click()
+    return at.run()
+
+
+def _submit_mech(at, **values):
+    """Isi number_input mekanikal (label -> nilai) lalu submit form."""
+    for widget in at.number_input:
+        if widget.label in values:
+            widget.set_value(values[widget.label])
+    return _click(at, "ANALISA MEKANIKAL")
+
+
+@pytest.fixture
+def at():
+    app = AppTest.from_file(_PAGE, default_timeout=30).run()
+    assert not app.exception
+    return app
+
+
+def test_generate_report_after_mechanical(at):
+    _submit_mech(at)
+    _click(at, "GENERATE REPORT")
+    assert not at.exception
+    assert at.session_state["health_result"]["status"] == "GOOD / PRIMA"
+
+
+@pytest.mark.parametrize("value, zone", [(2.79, "A"), (2.8, "B"), (7.09, "B"), (7.1, "D")])
+def test_mech_zone_from_max_vibration(at, value, zone):
+    _submit_mech(at, **{"M-DE H": value})
+    assert at.session_state["mech_result"]["zone"] == ISOZone[zone].value
+
+
+def test_vib_gauge_shows_exact_max(at):
+    _submit_mech(at, **{"M-DE H": 3.456})
+    spec = json.loads(at.get("plotly_chart")[0].proto.spec)
+    assert spec["data"][0]["value"] == 3.456
+
+
+def test_session_state_initialized_once(at):
+    assert at.session_state["_comm_initialized"]
+    assert at.session_state["mech_result"] is None and at.session_state["health_result"] is None
+
+    _submit_mech(at)
+    result = at.session_state["mech_result"]
+    at.run()
+    assert at.session_state["mech_result"] == result
+
+
+def test_physical_checklist_findings(at):
+    for box in at.checkbox:
+        if box.label in ("Major: Seal Bocor", "Minor: Oli Low/Dirty"):
+            box.check()
+    _submit_mech(at)
+    assert at.session_state["mech_result"]["phys"] == ["MAJOR: Seal Bocor", "MINOR: Oli Kotor"]
+    assert [w.value for w in at.warning] == ["MAJOR: Seal Bocor", "MINOR: Oli Kotor"]
+
+
+def test_mech_fragment_keeps_other_tabs(at):
+    _click(at, "ANALISA ELEKTRIKAL")
+    _submit_mech(at, **{"M-DE H": 5.0})
+    assert not at.exception
+    assert at.session_state["elec_result"] is not None
+    assert [m.label for m in at.metric] == ["Volt Unb", "Curr Unb", "Status"]
+    assert at.get("plotly_chart")
+
+
+def _health_card(at):
+    return next(m.value for m in at.markdown if m.value.startswith("<div"))
+
+
+def test_health_card_markup(at):
+    _submit_mech(at, **{"M-DE H": 8.0})
+    _click(at, "GENERATE REPORT")
+    hr = at.session_state["health_result"]
+    assert _health_card(at) == (
+        "<div style='background:#f8d7da;padding:20px;border-radius:10px;text-align:center;'>"
+        f"<h1 style='color:{hr['color']}'>{hr['status']}</h1><h3>{hr['desc']}</h3><hr>{hr['action']}</div>"
+    )
+
+
+@pytest.mark.parametrize("checkbox, value, background", [
+    (None, 0.5, "#d4edda"),
+    ("Minor: Baut Kendor", 0.5, "#fff3cd"),
+    (None, 8.0, "#f8d7da"),
+])
+def test_health_card_background(at, checkbox, value, background):
+    for box in at.checkbox:
+        if box.label == checkbox:
+            box.check()
+    _submit_mech(at, **{"M-DE H": value})
+    _click(at, "GENERATE REPORT")
+    assert _health_card(at).startswith(f"<div style='background:{background};")
+
+
+def test_health_reasons_single_markdown(at):
+    for box in at.checkbox:
+        if box.label == "Major: Seal Bocor":
+            box.check()
+    _submit_mech(at, **{"M-DE H": 8.0})
+    _click(at, "GENERATE REPORT")
+    reasons = at.session_state["health_result"]["reasons"]
+    assert len(reasons) > 1
+    assert "  \n".join(f"❌ {r}" for r in reasons) in [m.value for m in at.markdown]
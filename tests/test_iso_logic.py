@@ -0,0 +1,26 @@
+import math
+
+import pytest
+
+from iso_logic import LIMITS, get_iso_status, get_iso_status_batch
+
+
+@pytest.mark.parametrize("value, status", [
+    (0.0, "GOOD"),
+    (LIMITS.A, "GOOD"),
+    (LIMITS.A + 0.01, "SATISFACTORY"),
+    (LIMITS.B, "SATISFACTORY"),
+    (LIMITS.C, "UNSATISFACTORY"),
+    (LIMITS.C + 0.01, "UNACCEPTABLE"),
+])
+def test_get_iso_status_boundaries(value, status):
+    assert get_iso_status(value)[0] == status
+
+
+def test_get_iso_status_nan_is_unacceptable():
+    assert get_iso_status(math.nan) == ("UNACCEPTABLE", "error")
+
+
+def test_get_iso_status_batch_matches_scalar():
+    values = [0.0, LIMITS.A, 2.0, LIMITS.B, 5.0, LIMITS.C, 9.0, math.nan]
+    assert get_iso_status_batch(values) == [get_iso_status(v) for v in values]